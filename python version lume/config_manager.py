@@ -6,11 +6,34 @@ Security Hardened Version
 
 import json
 import os
+from logger_config import logger
 
-# Security: Whitelist valid configuration keys
-VALID_KEYS = {"target_folder", "appearance_mode", "language"}
-VALID_MODES = {"dark", "light"}
-VALID_LANGS = {"en", "tr"}
+try:
+    import orjson  # Optional: faster (de)serialization
+except ImportError:
+    orjson = None
+
+VALID_MODES = frozenset({"dark", "light"})
+VALID_LANGS = frozenset({"en", "tr"})
+VERIFY_MODES = ("auto", "full", "sample", "trust")  # Post-copy checks, applied by file_organizer.move_file
+VALID_VERIFY_MODES = frozenset(VERIFY_MODES)
+MAX_PATH_LENGTH = 260
+
+def _one_of(choices: frozenset):
+    """Builds a validator accepting only strings from choices."""
+    return lambda value: isinstance(value, str) and value in choices
+
+def _is_valid_folder_value(value) -> bool:
+    return value is None or (isinstance(value, str) and len(value) <= MAX_PATH_LENGTH)
+
+# Security: Whitelist valid configuration keys and their value checks
+_VALIDATORS = {
+    "target_folder": _is_valid_folder_value,
+    "appearance_mode": _one_of(VALID_MODES),
+    "language": _one_of(VALID_LANGS),
+    "verify_mode": _one_of(VALID_VERIFY_MODES),
+}
+VALID_KEYS = frozenset(_VALIDATORS)
 
 def get_config_path():
     """
@@ -24,17 +47,30 @@ def get_config_path():
         if not os.path.exists(lume_dir):
             os.makedirs(lume_dir, exist_ok=True)
     except OSError as e:
-        print(f"Error creating config directory: {e}")
+        logger.error(f"Error creating config directory: {e}")
         return None
         
     return os.path.join(lume_dir, 'config.json')
 
 CONFIG_FILE = get_config_path()
 
+def _loads(data: bytes):
+    """Parses JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _dumps(obj) -> bytes:
+    """Serializes to indented UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+
 DEFAULT_CONFIG = {
     "target_folder": None,
     "appearance_mode": "dark",
-    "language": "en"
+    "language": "en",
+    "verify_mode": "auto"
 }
 
 def load_config() -> dict:
@@ -45,34 +81,20 @@ def load_config() -> dict:
         return DEFAULT_CONFIG.copy()
     
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            config = json.load(f)
-            
-            # Security: Validate loaded config
-            validated_config = DEFAULT_CONFIG.copy()
-            
-            for key, value in config.items():
-                if key not in VALID_KEYS:
-                    continue
-                
-                # Validate values
-                if key == "appearance_mode" and value not in VALID_MODES:
-                    continue
-                if key == "language" and value not in VALID_LANGS:
-                    continue
-                if key == "target_folder" and value is not None:
-                    if not isinstance(value, str) or len(value) > 260:
-                        continue
-                
-                validated_config[key] = value
+        with open(CONFIG_FILE, "rb") as f:
+            config = _loads(f.read())
             
-            return validated_config
+            # Security: Validate loaded config (unknown keys and invalid values are dropped)
+            return {
+                **DEFAULT_CONFIG,
+                **{k: v for k, v in config.items() if k in _VALIDATORS and _VALIDATORS[k](v)}
+            }
             
     except (json.JSONDecodeError, ValueError) as e:
-        print(f"Config file corrupted, using defaults: {e}")
+        logger.warning(f"Config file corrupted, using defaults: {e}")
         return DEFAULT_CONFIG.copy()
     except Exception as e:
-        print(f"Error loading config: {e}")
+        logger.error(f"Error loading config: {e}")
         return DEFAULT_CONFIG.copy()
 
 def save_config(config_data: dict):
@@ -89,38 +111,26 @@ def save_config(config_data: dict):
             if key in VALID_KEYS:
                 safe_config[key] = value
         
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(safe_config, f, indent=4, ensure_ascii=False)
+        with open(CONFIG_FILE, "wb") as f:
+            f.write(_dumps(safe_config))
         return True
         
     except OSError as e:
-        print(f"Error saving config (permission denied): {e}")
+        logger.error(f"Error saving config (permission denied): {e}")
         return False
     except Exception as e:
-        print(f"Error saving config: {e}")
+        logger.error(f"Error saving config: {e}")
         return False
 
 def update_setting(key: str, value):
     """Updates a single setting in the config file with validation."""
-    # Security: Strict validation
-    if key not in VALID_KEYS:
-        return False
-
-    if key == "appearance_mode" and value not in VALID_MODES:
-        return False
-        
-    if key == "language" and value not in VALID_LANGS:
+    # Security: Strict validation (type, whitelist and path length)
+    validator = _VALIDATORS.get(key)
+    if validator is None or not validator(value):
         return False
 
     # Validation for target_folder
     if key == "target_folder" and value:
-        if not isinstance(value, str):
-            return False
-        
-        # Path length check
-        if len(value) > 260:
-            return False
-        
         # Existence check
         if not os.path.exists(value):
             return False
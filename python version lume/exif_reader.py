@@ -4,16 +4,30 @@ Security Hardened Version
 """
 
 import os
-import hashlib
+import re
 from datetime import datetime
-import piexif
-from logger_config import logger
+from stat import S_ISLNK
+import atexit
+import blake3
+from logger_config import logger, detach_file_handlers
+import hash_cache
+
+try:
+    import ahocorasick  # Optional: C-level multi-pattern matcher
+except ImportError:
+    ahocorasick = None
 
 # --- Constants ---
-SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.tiff', '.tif', '.webp', '.png', '.heic', '.mov', '.mp4'} 
+SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.tiff', '.tif', '.webp', '.png', '.heic', '.mov', '.mp4'})
+# piexif can only parse these; PNG/HEIC go straight to the file system fallback
+EXIF_EXTENSIONS = {'.jpg', '.jpeg', '.tiff', '.tif', '.webp'}
 MAX_METADATA_FILE_SIZE = 250 * 1024 * 1024  # 250MB
-HASH_BUFFER_SIZE = 64 * 1024  # 64KB streaming buffer
+HASH_BUFFER_SIZE = 4 * 1024 * 1024  # 4MB streaming buffer
+HASH_MMAP_MIN_SIZE = 16 * 1024 * 1024  # 16MB+ files are hashed via mmap
 QUICK_HASH_READ_SIZE = 4096  # 4KB for quick hash
+SAMPLE_HASH_READ_SIZE = 64 * 1024  # 64KB per sample for sample hash
+PARALLEL_MIN_FILES = 500  # Below this, the worker pool costs more than it saves
+PARALLEL_CHUNK_SIZE = 64  # Files per worker task (amortizes pickling)
 
 SOURCE_PATTERNS = {
     'WhatsApp': ['whatsapp', '-wa', '_wa'],
@@ -29,46 +43,62 @@ SOURCE_PATTERNS = {
     'AI Generated': ['dalle', 'midjourney', 'stable_diffusion']
 }
 
-def get_file_hash(file_path: str, quick: bool = True) -> str:
+_SOURCE_NAMES = list(SOURCE_PATTERNS)
+
+def _build_source_automaton():
+    """Builds a single Aho-Corasick automaton over all SOURCE_PATTERNS."""
+    automaton = ahocorasick.Automaton()
+    for priority, patterns in enumerate(SOURCE_PATTERNS.values()):
+        for pattern in patterns:
+            # Keep the first (highest priority) source if a pattern repeats
+            if pattern not in automaton:
+                automaton.add_word(pattern, priority)
+    automaton.make_automaton()
+    return automaton
+
+def _build_source_regex():
+    """
+    Fallback without pyahocorasick: one compiled regex over all SOURCE_PATTERNS.
+    The lookahead reports a match at every position, groups are named s<priority>.
+    """
+    groups = "|".join(
+        f"(?P<s{priority}>{'|'.join(re.escape(p) for p in patterns)})"
+        for priority, patterns in enumerate(SOURCE_PATTERNS.values())
+    )
+    return re.compile(f"(?=(?:{groups}))")
+
+_SOURCE_AUTOMATON = _build_source_automaton() if ahocorasick is not None else None
+_SOURCE_RE = _build_source_regex() if _SOURCE_AUTOMATON is None else None
+
+def get_file_hash(file_path: str, quick: bool = True, stat: os.stat_result = None,
+                  use_cache: bool = True) -> str:
     """
     Robust file identity with improved security.
     quick=True: Size + mtime + first 4KB hash (balanced)
-    quick=False: Full MD5 hash (reliable, for duplicate detection)
+    quick=False: Full BLAKE3 hash (reliable, for duplicate detection)
+    stat: Optional pre-computed os.lstat() result (saves a syscall)
+    use_cache: Consult the persistent hash cache (disable for integrity checks)
     """
     try:
-        # Security: Validate path first
-        real_path = os.path.realpath(file_path)
-        if real_path != file_path and os.path.islink(file_path):
+        # Security: Validate path first (one lstat, no realpath component walk)
+        if stat is None:
+            stat = os.lstat(file_path)
+        
+        if S_ISLNK(stat.st_mode):
             logger.warning(f"Symlink detected in hash calculation: {os.path.basename(file_path)}")
             return ""
         
-        stat = os.stat(file_path)
+        # Persistent cache: unchanged files are not re-read across runs
+        if use_cache:
+            cached = hash_cache.lookup(file_path, stat, quick)
+            if cached:
+                return cached
         
-        if quick:
-            # Improved quick hash: size + mtime + first 4KB
-            hasher = hashlib.md5()
-            
-            try:
-                with open(file_path, 'rb') as f:
-                    header = f.read(QUICK_HASH_READ_SIZE)
-                    hasher.update(header)
-                    header_hash = hasher.hexdigest()[:8]
-            except Exception:
-                header_hash = "00000000"
-            
-            return f"{stat.st_size}_{int(stat.st_mtime)}_{header_hash}"
-        else:
-            # Full file hash with streaming (memory efficient)
-            hasher = hashlib.md5()
-            
-            with open(file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(HASH_BUFFER_SIZE)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-            
-            return hasher.hexdigest()
+        file_hash = _compute_file_hash(file_path, quick, stat)
+        
+        if use_cache:
+            hash_cache.store(file_path, stat, quick, file_hash)
+        return file_hash
             
     except PermissionError:
         logger.error(f"Permission denied: {os.path.basename(file_path)}")
@@ -80,7 +110,67 @@ def get_file_hash(file_path: str, quick: bool = True) -> str:
         logger.warning(f"Hash calculation failed: {os.path.basename(file_path)} - {str(e)}")
         return ""
 
-def get_exif_data(file_path: str) -> dict:
+def _compute_file_hash(file_path: str, quick: bool, stat: os.stat_result) -> str:
+    """Hashes the file contents; errors propagate to get_file_hash."""
+    if quick:
+        # Improved quick hash: size + mtime + first 4KB
+        hasher = blake3.blake3()
+        
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(QUICK_HASH_READ_SIZE)
+                hasher.update(header)
+                header_hash = hasher.hexdigest()[:8]
+        except Exception:
+            header_hash = "00000000"
+        
+        return f"{stat.st_size}_{int(stat.st_mtime)}_{header_hash}"
+    else:
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        
+        if stat.st_size >= HASH_MMAP_MIN_SIZE:
+            # Large files: multi-threaded BLAKE3 over a read-only mmap (no userspace copy)
+            hasher.update_mmap(file_path)
+        else:
+            # Small files: stream through one reusable buffer (no per-chunk allocation)
+            buf = bytearray(min(HASH_BUFFER_SIZE, stat.st_size) or 1)
+            view = memoryview(buf)
+            
+            with open(file_path, 'rb') as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+        
+        return hasher.hexdigest()
+
+def get_sample_hash(file_path: str, stat: os.stat_result = None) -> str:
+    """
+    Cheap content fingerprint for copy verification of large files.
+    Hashes size + first, middle and last 64KB.
+    """
+    try:
+        if stat is None:
+            stat = os.stat(file_path)
+        
+        size = stat.st_size
+        hasher = blake3.blake3()
+        hasher.update(str(size).encode())
+        
+        offsets = (0, max(0, (size - SAMPLE_HASH_READ_SIZE) // 2), max(0, size - SAMPLE_HASH_READ_SIZE))
+        with open(file_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                hasher.update(f.read(SAMPLE_HASH_READ_SIZE))
+        
+        return hasher.hexdigest()
+    
+    except Exception as e:
+        logger.warning(f"Sample hash failed: {os.path.basename(file_path)} - {str(e)}")
+        return ""
+
+def get_exif_data(file_path: str, stat: os.stat_result = None) -> dict:
     """Reads EXIF data using PieXif with improved encoding handling."""
     result = {
         'date': None,
@@ -90,9 +180,14 @@ def get_exif_data(file_path: str) -> dict:
         'month': 'Unknown'
     }
     
+    import piexif  # Lazy: not needed until the first file is scanned
+    
     try:
-        # Load EXIF via PieXif
-        exif_dict = piexif.load(file_path)
+        # Load EXIF via PieXif (for JPEG it only reads the segment headers up to APP1)
+        if os.path.splitext(file_path)[1].lower() in EXIF_EXTENSIONS:
+            exif_dict = piexif.load(file_path)
+        else:
+            exif_dict = {}
         
         # 0th IFD (General info)
         if "0th" in exif_dict:
@@ -135,7 +230,7 @@ def get_exif_data(file_path: str) -> dict:
     # Fallback to file system stats
     if result['date'] is None:
         try:
-            file_stat = os.stat(file_path)
+            file_stat = stat if stat is not None else os.stat(file_path)
             creation_time = file_stat.st_ctime
             file_date = datetime.fromtimestamp(creation_time)
             
@@ -161,10 +256,14 @@ def detect_source(filename: str) -> str:
     try:
         filename_lower = filename.lower()
         
-        for source, patterns in SOURCE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in filename_lower:
-                    return source
+        # Single pass over the name; SOURCE_PATTERNS order decides ties
+        if _SOURCE_AUTOMATON is not None:
+            matches = [priority for _, priority in _SOURCE_AUTOMATON.iter(filename_lower)]
+        else:
+            matches = [int(m.lastgroup[1:]) for m in _SOURCE_RE.finditer(filename_lower)]
+        
+        if matches:
+            return _SOURCE_NAMES[min(matches)]
         
         # Camera detection
         if filename_lower.startswith(('img_', 'photo_', 'dsc')):
@@ -177,33 +276,37 @@ def detect_source(filename: str) -> str:
     except Exception:
         return None
 
-def get_file_info(file_path: str) -> dict:
-    """Gets comprehensive file info with security checks."""
+def get_file_info(file_path: str, stat: os.stat_result = None) -> dict:
+    """
+    Gets comprehensive file info with security checks.
+    stat: Optional pre-computed os.lstat() result (saves a syscall)
+    """
+    filename = os.path.basename(file_path)
     try:
-        # Security 1: Symlink & Junction Protection
-        real_path = os.path.realpath(file_path)
-        if real_path != file_path and os.path.islink(file_path):
-            logger.warning(f"Security: Symlink blocked - {os.path.basename(file_path)}")
+        # Security 1: Symlink & Junction Protection (one lstat, no realpath component walk)
+        # The same stat is shared with the helpers below
+        st = stat if stat is not None else os.lstat(file_path)
+        if S_ISLNK(st.st_mode):
+            logger.warning(f"Security: Symlink blocked - {filename}")
             return {}
         
         # Security 2: .lnk shortcut protection
         if file_path.lower().endswith('.lnk'):
-            logger.warning(f"Security: Shortcut blocked - {os.path.basename(file_path)}")
+            logger.warning(f"Security: Shortcut blocked - {filename}")
             return {}
         
         # Security 3: Path traversal check
         if '..' in file_path.split(os.sep):
-            logger.warning(f"Security: Path traversal blocked - {os.path.basename(file_path)}")
+            logger.warning(f"Security: Path traversal blocked - {filename}")
             return {}
         
-        # Get file size
-        file_size = os.path.getsize(file_path)
+        file_size = st.st_size
         ext = os.path.splitext(file_path)[1].lower()
         is_video = ext in {'.mov', '.mp4'}
         
         # Get EXIF data (skip for large files/videos)
-        if is_supported_image(file_path) and not is_video and file_size <= MAX_METADATA_FILE_SIZE:
-            exif_data = get_exif_data(file_path)
+        if ext in SUPPORTED_EXTENSIONS and not is_video and file_size <= MAX_METADATA_FILE_SIZE:
+            exif_data = get_exif_data(file_path, stat=st)
         else:
             if file_size > MAX_METADATA_FILE_SIZE:
                 logger.info(f"Large file ({file_size/1e6:.1f}MB), metadata skipped")
@@ -218,8 +321,7 @@ def get_file_info(file_path: str) -> dict:
             }
             
             try:
-                file_stat = os.stat(file_path)
-                file_date = datetime.fromtimestamp(file_stat.st_ctime)
+                file_date = datetime.fromtimestamp(st.st_ctime)
                 exif_data.update({
                     'date': file_date,
                     'date_str': file_date.strftime("%Y-%m-%d %H:%M") + " (File)",
@@ -229,7 +331,6 @@ def get_file_info(file_path: str) -> dict:
             except Exception:
                 pass
         
-        filename = os.path.basename(file_path)
         source = detect_source(filename)
         
         # Smart device naming
@@ -251,12 +352,56 @@ def get_file_info(file_path: str) -> dict:
             'device': device,
             'source': source,
             'year': exif_data['year'],
-            'month': exif_data['month']
+            'month': exif_data['month'],
+            'stat': st
         }
     
     except PermissionError:
         logger.error(f"Permission denied: {os.path.basename(file_path)}")
         return {}
+    except FileNotFoundError:
+        logger.error(f"File not found: {os.path.basename(file_path)}")
+        return {}
     except Exception as e:
         logger.error(f"Error reading file info: {os.path.basename(file_path)} - {str(e)}")
         return {}
+
+_executor = None  # Shared worker pool, started on the first large batch
+
+def _shutdown_executor():
+    """Stops the shared worker pool at exit."""
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+def _get_executor():
+    """Returns the shared worker pool, starting it once per session."""
+    global _executor
+    
+    if _executor is None:
+        from concurrent.futures import ProcessPoolExecutor  # Lazy: pulls in multiprocessing
+        
+        _executor = ProcessPoolExecutor(initializer=detach_file_handlers)
+    return _executor
+
+atexit.register(_shutdown_executor)
+
+def get_file_info_batch(paths: list, stats: list = None) -> list:
+    """
+    Gets file info for many files, parsing metadata in worker processes for large batches.
+    stats: Optional pre-computed os.lstat() results, aligned with paths
+    Returns results in input order ({} for rejected files).
+    """
+    global _executor
+    
+    if stats is None:
+        stats = [None] * len(paths)
+    
+    if len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            executor = _get_executor()
+            return list(executor.map(get_file_info, paths, stats, chunksize=PARALLEL_CHUNK_SIZE))
+        except Exception as e:
+            logger.warning(f"Parallel metadata scan failed, falling back to sequential: {str(e)}")
+            _executor = None  # A broken pool is rebuilt on the next large batch
+    
+    return [get_file_info(path, st) for path, st in zip(paths, stats)]
@@ -4,16 +4,39 @@ Security Hardened Version - Copy-Verify-Delete Method
 """
 
 import os
-import shutil
-import filecmp
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 from logger_config import logger
-from exif_reader import get_file_hash
+from config_manager import VERIFY_MODES
+from exif_reader import get_file_hash, get_sample_hash
+import hash_cache
 
 # Security Constants
 MAX_CONFLICT_WARNING = 1000
 MAX_CONFLICT_LIMIT = 10000
 
+# Copy Constants
+COPY_CHUNK_SIZE = 1 << 30  # 1GB per copy_file_range call
+NO_BUFFERING_MIN_SIZE = 256 * 1024 * 1024  # Unbuffered Windows copy for 256MB+ files
+_COPY_FILE_NO_BUFFERING = 0x00001000
+_FICLONE = 0x40049409  # Linux ioctl: clone the source's extents (btrfs, XFS, bcachefs)
+
+# Verify Constants (VERIFY_MODES is defined with the other config values)
+# auto: full hash below SAMPLE_VERIFY_MIN_SIZE, sample above, trust after a reflink clone
+SAMPLE_VERIFY_MIN_SIZE = 100 * 1024 * 1024  # 100MB
+
+# Invalid filename characters and control characters (0-31) map to '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*.' + ''.join(map(chr, range(32)))})
+
+# Windows reserved names
+_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL",
+    "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
+    "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
+})
+
+# Full hashes of existing target files, keyed by (path, size, mtime_ns)
+_target_hash_cache: Dict[Tuple[str, int, int], str] = {}
+
 def sanitize_folder_name(name: str) -> str:
     """
     Sanitizes folder name for filesystem safety.
@@ -23,24 +46,14 @@ def sanitize_folder_name(name: str) -> str:
     if name in (".", ".."):
         return "Unknown"
     
-    # Security 2: Remove invalid characters
-    invalid_chars = '<>:"/\\|?*.'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    
-    # Security 3: Remove control characters (0-31)
-    name = "".join(c if ord(c) > 31 else "_" for c in name)
+    # Security 2 & 3: Remove invalid and control characters (single pass)
+    name = name.translate(_SANITIZE_TABLE)
     
     # Security 4: Strip spaces and dots
     name = name.strip().strip('.')
     
     # Security 5: Windows reserved names
-    reserved = {
-        "CON", "PRN", "AUX", "NUL",
-        "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
-        "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
-    }
-    if name.upper() in reserved:
+    if name.upper() in _RESERVED_NAMES:
         name = f"{name}_safe"
     
     # Security 6: Length limit
@@ -66,9 +79,47 @@ def generate_target_path(base_path: str, year: str, month: str, device: str, fil
     
     return os.path.join(target_dir, filename)
 
-def handle_conflict(source_path: str, target_path: str) -> Tuple[str, bool]:
+def _get_target_hash(target_path: str) -> str:
+    """Returns the full hash of an existing target file, cached per (path, size, mtime)."""
+    try:
+        st = os.lstat(target_path)
+    except OSError:
+        return ""
+    
+    key = (target_path, st.st_size, st.st_mtime_ns)
+    cached = _target_hash_cache.get(key)
+    if cached is None:
+        cached = get_file_hash(target_path, quick=False, stat=st)
+        if cached:
+            _target_hash_cache[key] = cached
+    return cached
+
+def _quick_signature(quick_hash: str) -> Tuple[str, str]:
+    """Returns (size, header digest) of a quick hash; mtime is dropped since copies may differ."""
+    parts = quick_hash.split('_')
+    return parts[0], parts[-1]
+
+def _content_equal(target_path: str, source_quick: str, get_source_hash: Callable[[], str]) -> bool:
+    """Compares file contents via full hashes (source hashed on demand, targets cached)."""
+    # Prefilter: different size or first 4KB means different content, no full read needed
+    if source_quick:
+        target_quick = get_file_hash(target_path, quick=True)
+        if target_quick and _quick_signature(target_quick) != _quick_signature(source_quick):
+            return False
+    
+    source_hash = get_source_hash()
+    if not source_hash:
+        return False
+    
+    return source_hash == _get_target_hash(target_path)
+
+def handle_conflict(source_path: str, target_path: str, source_stat: os.stat_result = None,
+                    source_hash: str = None, source_quick: str = None) -> Tuple[str, bool]:
     """
     Handles naming conflicts and checks for duplicates.
+    source_stat: Optional pre-computed stat of the source (saves a syscall)
+    source_hash: Optional pre-computed full hash of the source (saves a full read)
+    source_quick: Optional quick hash of the source (prefilters candidates)
     Returns: (final_path, is_duplicate)
     """
     # Security: Use lexists to handle broken symlinks
@@ -77,7 +128,7 @@ def handle_conflict(source_path: str, target_path: str) -> Tuple[str, bool]:
     
     # Performance 1: Size comparison first
     try:
-        source_size = os.path.getsize(source_path)
+        source_size = source_stat.st_size if source_stat is not None else os.path.getsize(source_path)
         target_size = os.path.getsize(target_path)
         
         if source_size != target_size:
@@ -93,15 +144,21 @@ def handle_conflict(source_path: str, target_path: str) -> Tuple[str, bool]:
     except OSError as e:
         logger.warning(f"Size comparison failed: {e}")
     
-    # Performance 2: Deep content comparison
-    try:
-        if filecmp.cmp(source_path, target_path, shallow=False):
-            logger.info(f"Duplicate detected: {os.path.basename(source_path)}")
-            return target_path, True
-    except PermissionError:
-        logger.error(f"Permission denied comparing: {os.path.basename(source_path)}")
-    except Exception as e:
-        logger.warning(f"Comparison failed: {os.path.basename(source_path)} - {e}")
+    # Performance 2: Deep content comparison. The source is read in full only once a
+    # candidate passes the quick signature prefilter, and at most once.
+    if source_quick is None:
+        source_quick = get_file_hash(source_path, quick=True, stat=source_stat)
+    
+    full_hash = [source_hash]
+    
+    def get_source_hash() -> str:
+        if full_hash[0] is None:
+            full_hash[0] = get_file_hash(source_path, quick=False, stat=source_stat)
+        return full_hash[0]
+    
+    if _content_equal(target_path, source_quick, get_source_hash):
+        logger.info(f"Duplicate detected: {os.path.basename(source_path)}")
+        return target_path, True
     
     # Not identical - generate unique name
     base, ext = os.path.splitext(target_path)
@@ -114,12 +171,9 @@ def handle_conflict(source_path: str, target_path: str) -> Tuple[str, bool]:
             return new_path, False
         
         # Check if identical to numbered file
-        try:
-            if filecmp.cmp(source_path, new_path, shallow=False):
-                logger.info(f"Duplicate found at {counter}: {os.path.basename(source_path)}")
-                return new_path, True
-        except Exception:
-            pass
+        if _content_equal(new_path, source_quick, get_source_hash):
+            logger.info(f"Duplicate found at {counter}: {os.path.basename(source_path)}")
+            return new_path, True
         
         # Logging for high conflicts
         if counter == MAX_CONFLICT_WARNING:
@@ -132,6 +186,103 @@ def handle_conflict(source_path: str, target_path: str) -> Tuple[str, bool]:
             logger.error(f"Conflict limit exceeded ({MAX_CONFLICT_LIMIT})")
             raise Exception(f"Too many conflicts for: {os.path.basename(source_path)}")
 
+def _reflink(src: str, dst: str) -> None:
+    """Linux: clones src into dst via FICLONE; raises OSError where reflinks are unsupported."""
+    import fcntl
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+def _copy_file_range(src: str, dst: str) -> None:
+    """Linux: copies file data inside the kernel, without a userspace buffer."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        copied = 0
+        while True:
+            n = os.copy_file_range(in_fd, out_fd, COPY_CHUNK_SIZE)
+            if not n:
+                break
+            copied += n
+        
+        # Some filesystems report success without copying anything
+        if copied != size:
+            raise OSError(f"copy_file_range copied {copied} of {size} bytes")
+
+def _copy_file_ex(src: str, dst: str, size: int = None) -> None:
+    """Windows: copies via CopyFileExW (data, attributes and timestamps in one call)."""
+    import ctypes
+    
+    flags = _COPY_FILE_NO_BUFFERING if size and size >= NO_BUFFERING_MIN_SIZE else 0
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    if not kernel32.CopyFileExW(src, dst, None, None, None, flags):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def _fast_copy(src: str, dst: str, size: int = None) -> bool:
+    """
+    Copies file data and metadata like shutil.copy2, avoiding the userspace buffer where possible.
+    Falls back to shutil.copy2 if the kernel copy is unavailable (e.g. cross-device).
+    Returns: True only for a reflink clone, whose data shares the source's blocks
+    """
+    import shutil  # Lazy: only needed once organizing starts
+    
+    try:
+        if hasattr(os, 'copy_file_range'):
+            # A successful copy_file_range may be a plain data copy, so only FICLONE counts
+            try:
+                _reflink(src, dst)
+                shutil.copystat(src, dst)
+                return True
+            except OSError as e:
+                logger.debug(f"Reflink unavailable: {e}")
+            
+            _copy_file_range(src, dst)
+            shutil.copystat(src, dst)
+            return False
+        if os.name == 'nt':
+            _copy_file_ex(src, dst, size)
+            return False
+    except OSError as e:
+        logger.debug(f"Fast copy unavailable, using shutil: {e}")
+    
+    shutil.copy2(src, dst)
+    return False
+
+def _resolve_verify_mode(verify_mode: str, size: int, reflinked: bool) -> str:
+    """Turns the configured verify mode into 'full', 'sample' or 'trust' for one file."""
+    if verify_mode in ("full", "sample", "trust"):
+        return verify_mode
+    
+    # auto
+    if reflinked:
+        return "trust"
+    if size >= SAMPLE_VERIFY_MIN_SIZE:
+        return "sample"
+    return "full"
+
+def _verify_copy(source: str, target: str, source_hash: str, mode: str) -> bool:
+    """Checks that target matches source; falls back to a size compare without a reference hash."""
+    if mode == "sample":
+        source_sample = get_sample_hash(source)
+        if source_sample:
+            return source_sample == get_sample_hash(target)
+    elif mode == "full" and source_hash:
+        # Never trust the persistent cache for the copy itself
+        target_hash = get_file_hash(target, quick=False, use_cache=False)
+        if target_hash != source_hash:
+            return False
+        
+        # Verified copy: later conflicts against it can reuse the hash
+        try:
+            st = os.stat(target)
+            _target_hash_cache[(target, st.st_size, st.st_mtime_ns)] = target_hash
+        except OSError:
+            pass
+        return True
+    
+    # trust (or no reference hash available)
+    return os.path.getsize(source) == os.path.getsize(target)
+
 def ensure_directory(path: str) -> None:
     """Ensures directory exists with error handling."""
     try:
@@ -140,9 +291,10 @@ def ensure_directory(path: str) -> None:
         logger.error(f"Failed to create directory: {e}")
         raise
 
-def move_file(file_info: Dict, target_base: str) -> bool:
+def move_file(file_info: Dict, target_base: str, verify_mode: str = "auto") -> bool:
     """
     Moves file safely using copy-verify-delete method.
+    verify_mode: One of VERIFY_MODES, controls the post-copy integrity check
     Returns: True if successful or duplicate
     """
     source = None
@@ -152,10 +304,9 @@ def move_file(file_info: Dict, target_base: str) -> bool:
         source = file_info['path']
         filename = os.path.basename(source)
         
-        # Security: Validate source exists
-        if not os.path.exists(source):
-            logger.error(f"Source file not found: {filename}")
-            return False
+        # Fresh stat before anything is created: the source may have changed or vanished
+        # since the drop (FileNotFoundError is reported below)
+        source_stat = os.lstat(source)
         
         target = calculate_new_path(file_info, target_base)
         
@@ -170,8 +321,17 @@ def move_file(file_info: Dict, target_base: str) -> bool:
             logger.error(f"Security: Invalid target path for {filename}")
             return False
         
+        # Full source hash is only computed when needed: by handle_conflict for a deep
+        # compare, or below for a full verify (the hash cache makes a repeat call free)
+        source_hash = file_info.get('full_hash')
+        
         # Handle conflict & duplicate check
-        final_target, is_duplicate = handle_conflict(source, target)
+        final_target, is_duplicate = handle_conflict(
+            source, target,
+            source_stat=source_stat,
+            source_hash=source_hash,
+            source_quick=file_info.get('quick_hash')
+        )
         
         if is_duplicate:
             rel_path = os.path.relpath(final_target, target_base)
@@ -182,31 +342,30 @@ def move_file(file_info: Dict, target_base: str) -> bool:
         target_dir = os.path.dirname(final_target)
         ensure_directory(target_dir)
         
-        # Pre-copy integrity check
-        source_hash = file_info.get('quick_hash') or get_file_hash(source, quick=False)
-        
         # SAFE METHOD: Copy -> Verify -> Delete (instead of move)
         # Step 1: Copy file to target
-        shutil.copy2(source, final_target)
+        source_size = source_stat.st_size
+        reflinked = _fast_copy(source, final_target, source_size)
         
         # Step 2: Verify copy integrity
-        if source_hash:
-            target_hash = get_file_hash(final_target, quick=False)
+        mode = _resolve_verify_mode(verify_mode, source_size, reflinked)
+        if mode == "full" and not source_hash:
+            source_hash = get_file_hash(source, quick=False, stat=source_stat)
+        if not _verify_copy(source, final_target, source_hash, mode):
+            logger.error(f"Integrity check FAILED for {filename}! Removing corrupt copy...")
             
-            if target_hash != source_hash:
-                logger.error(f"Integrity check FAILED for {filename}! Removing corrupt copy...")
-                
-                # Remove corrupt copy
-                try:
-                    os.remove(final_target)
-                    logger.info(f"Corrupt copy removed, source preserved: {filename}")
-                except Exception as remove_err:
-                    logger.critical(f"CRITICAL: Failed to remove corrupt copy: {remove_err}")
-                return False
+            # Remove corrupt copy
+            try:
+                os.remove(final_target)
+                logger.info(f"Corrupt copy removed, source preserved: {filename}")
+            except Exception as remove_err:
+                logger.critical(f"CRITICAL: Failed to remove corrupt copy: {remove_err}")
+            return False
         
         # Step 3: Delete source only after verified copy
         try:
             os.remove(source)
+            hash_cache.forget(source)
         except PermissionError:
             logger.warning(f"Could not delete source (permission denied): {filename}")
             # Copy succeeded, source still exists - acceptable state
@@ -221,6 +380,10 @@ def move_file(file_info: Dict, target_base: str) -> bool:
     except KeyError as e:
         logger.error(f"Missing file info key: {e}")
         return False
+    except FileNotFoundError:
+        if source:
+            logger.error(f"Source file not found: {os.path.basename(source)}")
+        return False
     except PermissionError:
         if source:
             logger.error(f"Permission denied: {os.path.basename(source)}")
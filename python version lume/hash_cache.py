@@ -0,0 +1,187 @@
+"""
+Persistent Hash Cache
+Stores file hashes in a SQLite sidecar database in APPDATA so repeated
+scans of the same library skip re-hashing unchanged files.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import atexit
+from logger_config import logger
+
+# Cache Constants
+FLUSH_BATCH_SIZE = 256  # Pending writes before an automatic flush
+MAX_CACHE_ROWS = 200_000  # Least recently seen rows beyond this are pruned when the cache opens
+
+_COLUMNS = {True: "quick_hash", False: "full_hash"}
+
+_lock = threading.Lock()
+_conn = None
+_disabled = False
+_pending = {}  # (path, quick) -> (size, mtime_ns, inode, hash)
+_forgotten = set()  # Paths whose rows are deleted on the next flush
+_seen = set()  # Paths whose cache hits refresh last_seen on the next flush
+
+def get_cache_path():
+    """Returns the user-specific AppData path for the cache database."""
+    app_data = os.environ.get('APPDATA') or os.path.expanduser('~')
+    lume_dir = os.path.join(app_data, 'Lume')
+
+    try:
+        if not os.path.exists(lume_dir):
+            os.makedirs(lume_dir, exist_ok=True)
+    except OSError:
+        return None
+
+    return os.path.join(lume_dir, 'hash_cache.db')
+
+def _get_connection():
+    """Opens the database on first use. Caller must hold _lock."""
+    global _conn, _disabled
+
+    if _conn is not None or _disabled:
+        return _conn
+
+    cache_path = get_cache_path()
+    if not cache_path:
+        _disabled = True
+        return None
+
+    try:
+        conn = sqlite3.connect(cache_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_hashes ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, "
+            "quick_hash TEXT, full_hash TEXT, last_seen INTEGER DEFAULT 0)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(file_hashes)")}
+        if "last_seen" not in columns:  # Caches created before last_seen existed
+            conn.execute("ALTER TABLE file_hashes ADD COLUMN last_seen INTEGER DEFAULT 0")
+        conn.execute(
+            "DELETE FROM file_hashes WHERE rowid IN "
+            "(SELECT rowid FROM file_hashes ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+            (MAX_CACHE_ROWS,)
+        )
+        conn.commit()
+        _conn = conn
+    except sqlite3.Error as e:
+        logger.warning(f"Hash cache unavailable: {e}")
+        _disabled = True
+
+    return _conn
+
+def _cache_key(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(file_path))
+
+def _signature(stat: os.stat_result) -> tuple:
+    # Windows DirEntry.stat() reports st_ino as 0 while os.stat() fills it in,
+    # so the inode is left out there to keep both kinds of stat on the same key
+    inode = 0 if os.name == 'nt' else stat.st_ino
+    return (stat.st_size, stat.st_mtime_ns, inode)
+
+def lookup(file_path: str, stat: os.stat_result, quick: bool) -> str:
+    """Returns the cached hash if the file is unchanged since it was stored, else None."""
+    path = _cache_key(file_path)
+    signature = _signature(stat)
+
+    with _lock:
+        pending = _pending.get((path, quick))
+        if pending is not None:
+            return pending[3] if pending[:3] == signature else None
+
+        conn = _get_connection()
+        if conn is None or path in _forgotten:
+            return None
+
+        try:
+            row = conn.execute(
+                f"SELECT {_COLUMNS[quick]} FROM file_hashes "
+                "WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                (path, *signature)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Hash cache lookup failed: {e}")
+            return None
+
+        if row and row[0]:
+            _seen.add(path)
+
+    return row[0] if row else None
+
+def store(file_path: str, stat: os.stat_result, quick: bool, file_hash: str) -> None:
+    """Queues a hash for writing; flushed in batches."""
+    if not file_hash:
+        return
+
+    path = _cache_key(file_path)
+    with _lock:
+        _forgotten.discard(path)
+        _pending[(path, quick)] = (*_signature(stat), file_hash)
+        should_flush = len(_pending) >= FLUSH_BATCH_SIZE
+
+    if should_flush:
+        flush()
+
+def forget(file_path: str) -> None:
+    """Drops the cached hashes of a file that no longer exists (e.g. a moved source)."""
+    path = _cache_key(file_path)
+    with _lock:
+        for quick in _COLUMNS:
+            _pending.pop((path, quick), None)
+        _seen.discard(path)
+        _forgotten.add(path)
+        should_flush = len(_forgotten) >= FLUSH_BATCH_SIZE
+
+    if should_flush:
+        flush()
+
+def flush() -> None:
+    """Writes queued hashes and deletions to the database in one transaction."""
+    with _lock:
+        if not _pending and not _forgotten and not _seen:
+            return
+
+        now = int(time.time())
+        items = list(_pending.items())
+        forgotten = [(path,) for path in _forgotten]
+        seen = [(now, path) for path in _seen]
+        _pending.clear()
+        _forgotten.clear()
+        _seen.clear()
+
+        conn = _get_connection()
+        if conn is None:
+            return
+
+        try:
+            with conn:
+                if forgotten:
+                    conn.executemany("DELETE FROM file_hashes WHERE path = ?", forgotten)
+                if seen:
+                    conn.executemany("UPDATE file_hashes SET last_seen = ? WHERE path = ?", seen)
+
+                for quick, column in _COLUMNS.items():
+                    other = _COLUMNS[not quick]
+                    rows = [(path, *value, now) for (path, q), value in items if q == quick]
+                    if not rows:
+                        continue
+
+                    # Keep the other hash only if it belongs to the same file version
+                    conn.executemany(
+                        f"INSERT INTO file_hashes (path, size, mtime_ns, inode, {column}, last_seen) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        f"ON CONFLICT(path) DO UPDATE SET {column} = excluded.{column}, "
+                        f"{other} = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                        f"AND inode = excluded.inode THEN {other} END, "
+                        "size = excluded.size, mtime_ns = excluded.mtime_ns, inode = excluded.inode, "
+                        "last_seen = excluded.last_seen",
+                        rows
+                    )
+        except sqlite3.Error as e:
+            logger.debug(f"Hash cache write failed: {e}")
+
+atexit.register(flush)
@@ -56,5 +56,17 @@ def setup_logger():
     
     return logger
 
+def detach_file_handlers():
+    """
+    Closes the log file in a worker process (used as the pool initializer).
+    Several RotatingFileHandlers on the same app.log would interleave writes
+    and break rotation on Windows, so workers log to the console only.
+    """
+    logger = logging.getLogger("Lume")
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.FileHandler):
+            logger.removeHandler(handler)
+            handler.close()
+
 # Export the main logger
 logger = setup_logger()
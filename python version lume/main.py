@@ -5,25 +5,68 @@ Security Hardened Version
 """
 
 import os
+import re
 import time
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from pathlib import Path
+from tkinter import messagebox, ttk
 
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
-from exif_reader import get_file_info, is_supported_image, get_file_hash
+from exif_reader import get_file_info_batch, is_supported_image, get_file_hash
 from file_organizer import calculate_new_path, move_file, get_relative_path
-from ui_components import DropZone, FileTable, ProgressDialog
+from ui_components import DropZone, FileTable, ProgressDialog, _shared_style
 import config_manager
+import hash_cache
 from logger_config import logger
 
-from translations import get_text
+from translations import TRANSLATIONS, get_text
 
 # Security Constants
 MAX_FILES_LIMIT = 10000
 MAX_PATH_LENGTH = 260  # Windows MAX_PATH
+_DROP_STRIP = "{}\"' \t\r\n\v\f"  # Braces, quotes and ASCII whitespace around dropped paths
+
+# Performance Constants
+QUICK_HASH_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+QUICK_HASH_PARALLEL_MIN = 16  # Smaller drops hash inline
+PROGRESS_UPDATE_INTERVAL = 0.1  # Seconds between progress bar updates while organizing
+
+# Security: System directories blocked as targets (resolved once, case-normalized)
+_BLOCKED_DIRS = frozenset(
+    os.path.normcase(os.path.realpath(os.environ.get(key, default)))
+    for key, default in (
+        ('SYSTEMROOT', 'C:\\Windows'),
+        ('PROGRAMFILES', 'C:\\Program Files'),
+        ('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'),
+    )
+)
+_BLOCKED_PREFIXES = tuple(os.path.join(d, '') for d in _BLOCKED_DIRS)
+
+# Security: System paths blocked as drop sources (lowercased once for startswith)
+_SYSTEM_PREFIXES = tuple(
+    os.environ.get(key, default).lower()
+    for key, default in (
+        ('SYSTEMROOT', 'C:\\Windows'),
+        ('PROGRAMFILES', 'C:\\Program Files'),
+    )
+)
+_SEP = os.sep  # Bound once for the per-file traversal check
+# Words of a brace-free Tcl list; only these six characters separate list elements
+# (str.split() would also break names on NBSP and other Unicode whitespace)
+_TCL_LIST_WORD = re.compile(r'[^ \t\n\v\f\r]+')
+
+# Theme palettes, built once and swapped on toggle
+DARK_PALETTE = {
+    "bg": "#121212", "fg": "#FFFFFF", "card": "#1E1E1E", "accent": "#6366f1",
+    "btn_bg": "#333333", "btn_fg": "#FFFFFF", "header_bg": "#333333", "active": "#2A2A2A",
+}
+LIGHT_PALETTE = {
+    "bg": "#F9F9F9", "fg": "#333333", "card": "#FFFFFF", "accent": "#4F46E5",
+    "btn_bg": "#E0E0E0", "btn_fg": "#333333", "header_bg": "#EEEEEE", "active": "#EEEEEE",
+}
 
 class LumeApp(TkinterDnD.Tk):
     """Main application class (Super Lightweight - Security Hardened)."""
@@ -38,18 +81,23 @@ class LumeApp(TkinterDnD.Tk):
         # Pencere ayarları
         self.title("Lume")
         self.lang = self.config.get("language", "en")
+        self._lang_dict = TRANSLATIONS.get(self.lang, TRANSLATIONS["en"])
+        self._files_suffix = self._get_text('files')  # File count label suffix, refreshed on language change
         self.is_zen_mode = True
         self.geometry("500x450")
         self.resizable(False, False)
         
         # Tema / Renk Paleti (Zen Light/Dark)
         self.is_dark_mode = self.config.get("appearance_mode") == "dark"
+        self.style = _shared_style()  # The one ttk.Style, also used by the components
+        self.style.theme_use("clam")  # Honors custom colors (the native Windows theme ignores them)
         self._apply_theme_colors()
         
         # Veri depolama
         self.files_data = [] 
         self.added_hashes = set() 
         self.target_folder = self.config.get("target_folder")
+        self._status_after_id = None
         
         # Security: Validate target folder on startup
         if self.target_folder and not self._validate_target_folder(self.target_folder):
@@ -86,21 +134,11 @@ class LumeApp(TkinterDnD.Tk):
                 logger.warning("Target folder not writable")
                 return False
             
-            # Block system directories using pathlib
-            system_paths = [
-                Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')),
-                Path(os.environ.get('PROGRAMFILES', 'C:\\Program Files')),
-                Path(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')),
-            ]
-            
-            resolved_path = Path(real_path).resolve()
-            for sys_path in system_paths:
-                try:
-                    resolved_path.relative_to(sys_path.resolve())
-                    logger.error(f"System directory blocked")
-                    return False
-                except ValueError:
-                    pass  # Not relative to this system path, which is good
+            # Block system directories (the folder itself or anything below it)
+            resolved_path = os.path.normcase(real_path)
+            if resolved_path in _BLOCKED_DIRS or resolved_path.startswith(_BLOCKED_PREFIXES):
+                logger.error(f"System directory blocked")
+                return False
             
             return True
             
@@ -116,39 +154,33 @@ class LumeApp(TkinterDnD.Tk):
 
     def _apply_theme_colors(self):
         """Renk paletini ayarlar."""
-        if self.is_dark_mode:
-            self.bg_color = "#121212"
-            self.fg_color = "#FFFFFF"
-            self.card_color = "#1E1E1E"
-            self.accent_color = "#6366f1"
-        else:
-            self.bg_color = "#F9F9F9"
-            self.fg_color = "#333333"
-            self.card_color = "#FFFFFF"
-            self.accent_color = "#4F46E5"
+        self.palette = DARK_PALETTE if self.is_dark_mode else LIGHT_PALETTE
+        self.configure(bg=self.palette["bg"])
         
-        self.configure(bg=self.bg_color)
+        # Container frames are ttk and follow these styles, so they retheme in two calls
+        self.style.configure("Lume.TFrame", background=self.palette["bg"])
+        self.style.configure("Card.TFrame", background=self.palette["card"])
 
     def _create_ui(self):
         """Builds the user interface."""
         
         # Ana container
-        self.main_container = tk.Frame(self, bg=self.bg_color)
+        self.main_container = ttk.Frame(self, style="Lume.TFrame")
         self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Üst Panel (Başlık + Tema)
-        header_frame = tk.Frame(self.main_container, bg=self.bg_color)
+        header_frame = ttk.Frame(self.main_container, style="Lume.TFrame")
         header_frame.pack(fill="x", pady=(0, 20))
         
         # Logo Konteynırı
-        logo_container = tk.Frame(header_frame, bg=self.accent_color, padx=5, pady=2)
+        logo_container = tk.Frame(header_frame, bg=self.palette["accent"], padx=5, pady=2)
         logo_container.pack(side="left", padx=(0, 10))
 
         self.logo_text_label = tk.Label(
             header_frame, 
             text="Lume", 
             font=("Segoe UI", 26, "bold"), 
-            bg=self.bg_color, fg=self.accent_color
+            bg=self.palette["bg"], fg=self.palette["accent"]
         )
         self.logo_text_label.pack(side="left")
         
@@ -156,7 +188,7 @@ class LumeApp(TkinterDnD.Tk):
             header_frame,
             text="☀️" if self.is_dark_mode else "🌙",
             font=("Segoe UI Emoji", 12),
-            bg=self.card_color, fg=self.fg_color,
+            bg=self.palette["card"], fg=self.palette["fg"],
             relief="flat", width=4, height=1,
             command=self._toggle_theme
         )
@@ -166,7 +198,7 @@ class LumeApp(TkinterDnD.Tk):
             header_frame,
             text=self._get_text("lang_name"),
             font=("Segoe UI", 9, "bold"),
-            bg=self.card_color, fg=self.fg_color,
+            bg=self.palette["card"], fg=self.palette["fg"],
             relief="flat", width=4, height=1,
             command=self._toggle_language
         )
@@ -175,20 +207,20 @@ class LumeApp(TkinterDnD.Tk):
         # Sürükle-bırak alanı
         self.drop_zone = DropZone(
             self.main_container, 
-            bg_color=self.card_color, 
-            active_color="#EEEEEE" if not self.is_dark_mode else "#2A2A2A"
+            bg_color=self.palette["card"], 
+            active_color=self.palette["active"]
         )
         self.drop_zone.pack(fill="x", pady=(0, 15))
         
         # Zen Mode'da gizli olan kısım
-        self.expanded_container = tk.Frame(self.main_container, bg=self.bg_color)
+        self.expanded_container = ttk.Frame(self.main_container, style="Lume.TFrame")
         
         # File table
         self.file_list_label = tk.Label(
             self.expanded_container, 
             text=self._get_text("file_list"), 
             font=("Segoe UI", 10, "bold"), 
-            bg=self.bg_color, fg="#888888"
+            bg=self.palette["bg"], fg="#888888"
         )
         self.file_list_label.pack(anchor="w", pady=(10, 5))
         
@@ -196,24 +228,25 @@ class LumeApp(TkinterDnD.Tk):
         self.file_table.pack(fill="x", pady=(0, 10))
 
         # Hedef klasör seçimi
-        self.folder_frame = tk.Frame(self.main_container, bg=self.card_color, bd=1, relief="solid")
+        self.folder_frame = ttk.Frame(self.main_container, style="Card.TFrame", borderwidth=1, relief="solid")
         self.folder_frame.pack(fill="x", pady=(0, 10))
         
-        folder_inner = tk.Frame(self.folder_frame, bg=self.card_color)
+        folder_inner = ttk.Frame(self.folder_frame, style="Card.TFrame")
         folder_inner.pack(fill="x", padx=15, pady=10)
         
-        tk.Label(folder_inner, text="📂", font=("Segoe UI", 14), bg=self.card_color).pack(side="left")
+        folder_icon = tk.Label(folder_inner, text="📂", font=("Segoe UI", 14), bg=self.palette["card"])
+        folder_icon.pack(side="left")
         
-        text_frame = tk.Frame(folder_inner, bg=self.card_color)
+        text_frame = ttk.Frame(folder_inner, style="Card.TFrame")
         text_frame.pack(side="left", padx=10)
-        self.target_folder_tag_label = tk.Label(text_frame, text=self._get_text("target_folder_tag"), font=("Segoe UI", 9, "bold"), bg=self.card_color, fg=self.fg_color)
+        self.target_folder_tag_label = tk.Label(text_frame, text=self._get_text("target_folder_tag"), font=("Segoe UI", 9, "bold"), bg=self.palette["card"], fg=self.palette["fg"])
         self.target_folder_tag_label.pack(anchor="w")
         
-        self.folder_path_label = tk.Label(text_frame, text=self._get_text("not_selected"), font=("Segoe UI", 8), bg=self.card_color, fg="#888888")
+        self.folder_path_label = tk.Label(text_frame, text=self._get_text("not_selected"), font=("Segoe UI", 8), bg=self.palette["card"], fg="#888888")
         self.folder_path_label.pack(anchor="w")
         
         self.select_folder_btn = tk.Button(
-            folder_inner, text=self._get_text("select"), bg="#E0E0E0", relief="flat", padx=10, 
+            folder_inner, text=self._get_text("select"), bg=self.palette["btn_bg"], relief="flat", padx=10, 
             command=self._select_folder
         )
         self.select_folder_btn.pack(side="right")
@@ -223,16 +256,16 @@ class LumeApp(TkinterDnD.Tk):
             self.main_container, 
             text=self._get_text("supports"),
             font=("Segoe UI", 7), 
-            bg=self.bg_color, fg="#AAAAAA"
+            bg=self.palette["bg"], fg="#AAAAAA"
         )
         self.formats_label.pack(pady=(5, 0))
 
         # Progress Section
-        self.progress = ProgressDialog(self.expanded_container, bg=self.bg_color)
+        self.progress = ProgressDialog(self.expanded_container, bg=self.palette["bg"])
         self.progress.pack(fill="x", pady=(0, 10))
 
         # Buttons
-        self.button_frame = tk.Frame(self.expanded_container, bg=self.bg_color)
+        self.button_frame = ttk.Frame(self.expanded_container, style="Lume.TFrame")
         self.button_frame.pack(fill="x")
         
         self.start_btn = tk.Button(
@@ -244,14 +277,27 @@ class LumeApp(TkinterDnD.Tk):
 
         self.clear_btn = tk.Button(
             self.button_frame, text="🗑️", 
-            font=("Segoe UI", 10), bg="#E0E0E0", 
+            font=("Segoe UI", 10), bg=self.palette["btn_bg"], 
             relief="flat", width=5, command=self._clear_list
         )
         self.clear_btn.pack(side="left", padx=(0, 10))
 
-        self.file_count_label = tk.Label(self.button_frame, text=f"0 {self._get_text('files')}", bg=self.bg_color, fg="#888888")
+        self.file_count_label = tk.Label(self.button_frame, text=f"0 {self._files_suffix}", bg=self.palette["bg"], fg="#888888")
         self.file_count_label.pack(side="left")
 
+        # Plain tk widgets recolored on theme change, keyed by role; see _update_theme_widgets
+        # (ttk container frames follow their styles instead)
+        self._themed_widgets = {
+            "bg": [self.formats_label],
+            "card": [folder_icon],
+            "accent": [logo_container],
+            "logo": [self.logo_text_label],
+            "muted": [self.file_list_label, self.file_count_label],
+            "card_text": [self.theme_btn, self.lang_btn, self.target_folder_tag_label],
+            "card_muted": [self.folder_path_label],
+            "button": [self.select_folder_btn, self.clear_btn],
+        }
+
         # Initial Language Update
         self._update_language_ui()
         
@@ -265,7 +311,7 @@ class LumeApp(TkinterDnD.Tk):
         
         # Renkleri ve Iconu Güncelle
         self._apply_theme_colors()
-        self.theme_btn.configure(text="☀️" if self.is_dark_mode else "🌙", bg=self.card_color, fg=self.fg_color)
+        self.theme_btn.configure(text="☀️" if self.is_dark_mode else "🌙", bg=self.palette["card"], fg=self.palette["fg"])
         
         # Optimized theme update - only update necessary widgets
         self._update_theme_widgets()
@@ -273,79 +319,66 @@ class LumeApp(TkinterDnD.Tk):
 
     def _update_theme_widgets(self):
         """Optimized theme update - only updates changed widgets."""
+        p = self.palette
+
         # Update special components with their own update methods
         if hasattr(self.drop_zone, "update_theme"):
             self.drop_zone.update_theme(
-                self.bg_color, 
-                self.card_color, 
-                self.fg_color, 
-                "#2A2A2A" if self.is_dark_mode else "#EEEEEE"
+                p["bg"], 
+                p["card"], 
+                p["fg"], 
+                p["active"]
             )
         
         if hasattr(self.file_table, "update_theme"):
-            header_bg = "#333333" if self.is_dark_mode else "#EEEEEE"
             self.file_table.update_theme(
-                self.bg_color, 
-                self.card_color, 
-                self.fg_color, 
-                header_bg=header_bg
+                p["bg"], 
+                p["card"], 
+                p["fg"], 
+                is_dark=self.is_dark_mode,
+                header_bg=p["header_bg"]
             )
         
         if hasattr(self.progress, "update_theme"):
-            self.progress.update_theme(self.bg_color, self.fg_color)
-        
-        # Update main container
-        self.main_container.configure(bg=self.bg_color)
-        self.expanded_container.configure(bg=self.bg_color)
-        
-        # Update buttons and labels
-        self.theme_btn.configure(bg=self.card_color, fg=self.fg_color)
-        self.lang_btn.configure(bg=self.card_color, fg=self.fg_color)
-        self.logo_text_label.configure(bg=self.bg_color, fg=self.accent_color)
-        
-        # FIX: Update folder frame and ALL its children for dark mode
-        self.folder_frame.configure(bg=self.card_color)
-        btn_bg = "#333333" if self.is_dark_mode else "#E0E0E0"
-        btn_fg = "#FFFFFF" if self.is_dark_mode else "#333333"
-        self.select_folder_btn.configure(bg=btn_bg, fg=btn_fg)
-        self.target_folder_tag_label.configure(bg=self.card_color, fg=self.fg_color)
-        self.folder_path_label.configure(bg=self.card_color, fg="#888888")
-        self.formats_label.configure(bg=self.bg_color)
-        self.clear_btn.configure(bg=btn_bg, fg=btn_fg)
-        self.button_frame.configure(bg=self.bg_color)
-        
-        # Recursively update folder_frame children
-        for child in self.folder_frame.winfo_children():
-            try:
-                child.configure(bg=self.card_color)
-                for subchild in child.winfo_children():
-                    try:
-                        if isinstance(subchild, tk.Label):
-                            subchild.configure(bg=self.card_color)
-                        elif isinstance(subchild, tk.Frame):
-                            subchild.configure(bg=self.card_color)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-        
-        # Update other labels
-        for widget in [self.file_list_label, self.file_count_label]:
-            widget.configure(bg=self.bg_color, fg="#888888")
+            self.progress.update_theme(p["bg"], p["fg"], is_dark=self.is_dark_mode)
+        
+        # Resolve each role once; frames only take -background
+        role_options = {
+            "bg": f"-background {p['bg']}",
+            "card": f"-background {p['card']}",
+            "accent": f"-background {p['accent']}",
+            "logo": f"-background {p['bg']} -foreground {p['accent']}",
+            "muted": f"-background {p['bg']} -foreground #888888",
+            "card_text": f"-background {p['card']} -foreground {p['fg']}",
+            "card_muted": f"-background {p['card']} -foreground #888888",
+            "button": f"-background {p['btn_bg']} -foreground {p['btn_fg']}",
+        }
+
+        # One Tcl round-trip for all plain widgets instead of a configure call each
+        script = "\n".join(
+            f"{widget} configure {role_options[role]}"
+            for role, widgets in self._themed_widgets.items()
+            for widget in widgets
+        )
+        self.tk.eval(script)
 
     def _get_text(self, key, **kwargs):
         """Helper to get translated text."""
-        return get_text(self.lang, key, **kwargs)
+        if kwargs:
+            return get_text(self.lang, key, **kwargs)  # Formatting with fallback on bad kwargs
+        return self._lang_dict.get(key, key)
 
     def _toggle_language(self):
         """Switch between TR and EN."""
         self.lang = "tr" if self.lang == "en" else "en"
+        self._lang_dict = TRANSLATIONS[self.lang]
         config_manager.update_setting("language", self.lang)
         self._update_language_ui()
         logger.info(f"Language changed to: {self.lang}")
 
     def _update_language_ui(self):
         """Refreshes all UI text elements with current language."""
+        self._files_suffix = self._get_text('files')
         self.lang_btn.configure(text=self._get_text("lang_name"))
         self.file_list_label.configure(text=self._get_text("file_list"))
         self.target_folder_tag_label.configure(text=self._get_text("target_folder_tag"))
@@ -356,7 +389,7 @@ class LumeApp(TkinterDnD.Tk):
         self.select_folder_btn.configure(text=self._get_text("select"))
         self.formats_label.configure(text=self._get_text("supports"))
         self.start_btn.configure(text=self._get_text("start"))
-        self.file_count_label.configure(text=f"{len(self.files_data)} {self._get_text('files')}")
+        self.file_count_label.configure(text=f"{len(self.files_data)} {self._files_suffix}")
         
         # Components
         self.drop_zone.update_labels(self._get_text("drop_main"), self._get_text("drop_sub"))
@@ -387,14 +420,34 @@ class LumeApp(TkinterDnD.Tk):
         paths = self._parse_drop_data(event.data)
         logger.info(f"Dropped {len(paths)} items")
         
-        added_count = 0
         unsupported_formats = False
-        duplicates = False
         security_blocked = False
+        limit_hit = False  # Warning shown once, after the list and status are updated
+        
+        # Collect candidate files, then add them in batches. The limit counts files actually
+        # added, so duplicates and rejected files found by _add_files do not use up the budget.
+        file_paths = []
+        remaining = MAX_FILES_LIMIT - len(self.files_data)
+        totals = [0, 0, 0]  # added, duplicates, blocked
+        
+        def make_room():
+            """True if one more candidate fits; adds the full pending batch first if needed."""
+            nonlocal remaining
+            if len(file_paths) < remaining:
+                return True
+            for i, count in enumerate(self._add_files(file_paths)):
+                totals[i] += count
+            file_paths.clear()
+            remaining = MAX_FILES_LIMIT - len(self.files_data)
+            return remaining > 0
+        
+        # Optimized: Re-dropped paths are skipped before any hashing I/O
+        seen_paths = {os.path.normcase(info['path']) for info in self.files_data}
+        path_duplicates = 0
         
         for path in paths:
             # Temizlik: Süslü parantez, tırnak ve gizli boşlukları temizle
-            path = path.strip('{}').strip('"').strip("'").strip()
+            path = path.strip(_DROP_STRIP).strip()  # Second strip() covers Unicode whitespace
             if not path: 
                 continue
             
@@ -407,51 +460,68 @@ class LumeApp(TkinterDnD.Tk):
             # Windows dosya yolu düzeltmesi
             path = os.path.normpath(path)
             
+            # Optimized: Cheapest filter first - unsupported files never reach realpath
+            if not is_supported_image(path) and not os.path.isdir(path):
+                unsupported_formats = True
+                continue
+            
             # Security: Validate path before processing
             if not self._is_safe_path(path):
                 security_blocked = True
                 continue
             
-            # Security: Check file limit
-            if len(self.files_data) >= MAX_FILES_LIMIT:
-                messagebox.showwarning("Lume", self._get_text("warn_file_limit"))
-                break
-            
             if os.path.isfile(path):
-                if is_supported_image(path):
-                    result = self._add_file(path)
-                    if result == "added":
-                        added_count += 1
-                    elif result == "duplicate":
-                        duplicates = True
-                    elif result == "blocked":
-                        security_blocked = True
-                else:
-                    unsupported_formats = True
+                key = os.path.normcase(path)
+                if key in seen_paths:
+                    path_duplicates += 1
+                    continue
+                
+                # Security: Check file limit (only once another file is actually waiting)
+                if not make_room():
+                    limit_hit = True
+                    break
+                seen_paths.add(key)
+                file_paths.append(path)
             elif os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        if len(self.files_data) >= MAX_FILES_LIMIT:
-                            break
-                        
-                        fp = os.path.join(root, f)
-                        
-                        # Security: Skip if path too long
-                        if len(fp) > MAX_PATH_LENGTH:
-                            continue
-                        
-                        if is_supported_image(fp):
-                            result = self._add_file(fp)
-                            if result == "added":
-                                added_count += 1
-                            elif result == "duplicate":
-                                duplicates = True
-                            elif result == "blocked":
-                                security_blocked = True
-                        else:
-                            unsupported_formats = True
-        
-        self.file_count_label.configure(text=f"{len(self.files_data)} {self._get_text('files')}")
+                for entry in self._walk_files(path):
+                    # Security: Skip if path too long
+                    if len(entry.path) > MAX_PATH_LENGTH:
+                        continue
+                    
+                    if not is_supported_image(entry.name):
+                        unsupported_formats = True
+                        continue
+                    
+                    key = os.path.normcase(entry.path)
+                    if key in seen_paths:
+                        path_duplicates += 1
+                        continue
+                    
+                    # Security: Entries below a dropped folder are validated here, once
+                    if not self._is_safe_path(entry.path):
+                        security_blocked = True
+                        continue
+                    
+                    # Security: Check file limit; breaking closes the generator and ends the scan
+                    if not make_room():
+                        limit_hit = True
+                        break
+                    
+                    # DirEntry carries a cached stat, passed on to _add_files
+                    seen_paths.add(key)
+                    file_paths.append(entry)
+                
+                if limit_hit:
+                    break
+        
+        for i, count in enumerate(self._add_files(file_paths)):
+            totals[i] += count
+        added_count, duplicate_count, blocked_count = totals
+        duplicates = duplicate_count + path_duplicates > 0
+        if blocked_count:
+            security_blocked = True
+        
+        self.file_count_label.configure(text=f"{len(self.files_data)} {self._files_suffix}")
         
         # Status messages
         if security_blocked:
@@ -465,40 +535,56 @@ class LumeApp(TkinterDnD.Tk):
                 self._show_status(self._get_text("err_none"), "orange")
         elif unsupported_formats or duplicates:
             self._show_status(self._get_text("success_added", count=added_count), "blue")
+        
+        if limit_hit:
+            messagebox.showwarning("Lume", self._get_text("warn_file_limit"))
+
+    def _walk_files(self, folder):
+        """Yields file DirEntry objects under folder (os.walk order, symlinked dirs not followed)."""
+        stack = [folder]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    subdirs = []
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                if not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                                continue
+                        except OSError:
+                            continue
+                        yield entry
+            except OSError:
+                continue  # Unreadable folder, skip like os.walk
+            
+            stack.extend(reversed(subdirs))
 
     def _is_safe_path(self, path):
         """Security: Validates path for safety."""
         try:
-            # Resolve real path (detects symlinks, junctions, etc.)
-            real_path = os.path.realpath(path)
-            
-            # Check if path was modified (symlink/junction detection)
-            norm_path = os.path.normpath(path)
-            if real_path != norm_path and os.path.islink(path):
-                logger.warning(f"Symlink/junction blocked: {os.path.basename(path)}")
-                return False
-            
-            # Block .lnk files
+            # Block .lnk files (string checks run before any filesystem call)
             if path.lower().endswith('.lnk'):
                 logger.warning(f"Shortcut file blocked: {os.path.basename(path)}")
                 return False
             
             # Path traversal check
-            if '..' in path.split(os.sep):
+            if '..' in path.split(_SEP):
                 logger.warning(f"Path traversal attempt blocked: {path}")
                 return False
             
+            # Resolve real path once (realpath also normalizes; detects symlinks, junctions, etc.)
+            real_path = os.path.realpath(path)
+            
             # Block system directories
-            system_paths = [
-                os.environ.get('SYSTEMROOT', 'C:\\Windows').lower(),
-                os.environ.get('PROGRAMFILES', 'C:\\Program Files').lower(),
-            ]
+            if real_path.lower().startswith(_SYSTEM_PREFIXES):
+                logger.warning(f"System path blocked: {path}")
+                return False
             
-            real_path_lower = real_path.lower()
-            for sys_path in system_paths:
-                if real_path_lower.startswith(sys_path):
-                    logger.warning(f"System path blocked: {path}")
-                    return False
+            # Symlink/junction detection, only needed when resolution changed the path
+            if real_path != path and os.path.islink(path):
+                logger.warning(f"Symlink/junction blocked: {os.path.basename(path)}")
+                return False
             
             return True
             
@@ -509,21 +595,27 @@ class LumeApp(TkinterDnD.Tk):
     def _show_status(self, text, color=None):
         """Shows a temporary status message at the bottom."""
         if not color: 
-            color = self.fg_color
-        
-        # Save current state
-        old_text = f"{len(self.files_data)} {self._get_text('files')}"
-        old_color = "#888888"
+            color = self.palette["fg"]
         
         # Show new message
         self.file_count_label.configure(text=text, fg=color)
         logger.info(f"Status: {text}")
         
-        # Reset after 4 seconds
-        self.after(4000, lambda: self.file_count_label.configure(text=old_text, fg=old_color))
+        # Reset after 4 seconds; a newer status replaces the pending reset
+        if self._status_after_id:
+            self.after_cancel(self._status_after_id)
+        self._status_after_id = self.after(4000, self._reset_status)
+
+    def _reset_status(self):
+        """Restores the file count after a temporary status message."""
+        self._status_after_id = None
+        self.file_count_label.configure(text=f"{len(self.files_data)} {self._files_suffix}", fg="#888888")
 
     def _parse_drop_data(self, data):
         """Tcl list parçalama."""
+        # Fast path: without braces, quotes or escapes a Tcl list is plain whitespace-separated words
+        if '{' not in data and '"' not in data and '\\' not in data:
+            return _TCL_LIST_WORD.findall(data)
         return self.tk.splitlist(data)
 
     def _expand_ui(self):
@@ -533,50 +625,102 @@ class LumeApp(TkinterDnD.Tk):
             self.geometry("800x800")
             self.expanded_container.pack(fill="both", expand=True)
 
-    def _add_file(self, file_path):
-        """Adds file to list with security checks. Returns: 'added', 'duplicate', 'blocked'"""
+    def _add_files(self, file_paths):
+        """
+        Adds files (paths or os.DirEntry objects) to list.
+        Paths must already have passed _is_safe_path (done once, in _on_drop).
+        Returns: (added, duplicates, blocked) counts
+        """
         if self.is_zen_mode: 
             self._expand_ui()
         
-        # Security: Additional path validation
-        if not self._is_safe_path(file_path):
-            return "blocked"
-        
-        # Optimized: Calculate hash once
-        file_hash = get_file_hash(file_path, quick=True)
-        if not file_hash:
-            logger.warning(f"Hash calculation failed: {os.path.basename(file_path)}")
-            return "blocked"
-        
-        if file_hash in self.added_hashes: 
-            return "duplicate"
+        added = duplicates = blocked = 0
+        candidates = []  # (path, stat) of files that passed the cheap checks
         
-        info = get_file_info(file_path)
-        if not info:  # Rejection (Symlink etc)
-            return "blocked"
+        for item in file_paths:
+            file_path = item.path if isinstance(item, os.DirEntry) else item
+            
+            # Optimized: Stat once (free for scandir entries) and share it with the hash/info helpers
+            try:
+                if isinstance(item, os.DirEntry):
+                    file_stat = item.stat(follow_symlinks=False)
+                else:
+                    file_stat = os.stat(file_path, follow_symlinks=False)
+            except OSError:
+                logger.warning(f"Stat failed: {os.path.basename(file_path)}")
+                blocked += 1
+                continue
+            
+            candidates.append((file_path, file_stat))
         
-        # Store both hashes
-        info['quick_hash'] = file_hash
-        info['full_hash'] = get_file_hash(file_path, quick=False)
+        # Optimized: Quick hashes are I/O-bound, so larger drops read them on a thread pool
+        def quick_hash(candidate):
+            return get_file_hash(candidate[0], quick=True, stat=candidate[1])
         
-        if self.target_folder:
-            new_path = calculate_new_path(info, self.target_folder)
-            rel = get_relative_path(new_path, self.target_folder)
+        if len(candidates) >= QUICK_HASH_PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=QUICK_HASH_WORKERS) as executor:
+                hashes = list(executor.map(quick_hash, candidates))
         else:
-            rel = "..."
+            hashes = [quick_hash(candidate) for candidate in candidates]
         
-        self.files_data.append(info)
-        self.added_hashes.add(file_hash)
+        pending = []  # (path, stat, quick_hash) of unique files
+        pending_hashes = set()
         
-        self.file_table.add_row(
-            info['filename'], 
-            info['date_str'], 
-            info['device'], 
-            self._sanitize_path_display(rel, 30)
+        for (file_path, file_stat), file_hash in zip(candidates, hashes):
+            if not file_hash:
+                logger.warning(f"Hash calculation failed: {os.path.basename(file_path)}")
+                blocked += 1
+                continue
+            
+            if file_hash in self.added_hashes or file_hash in pending_hashes: 
+                duplicates += 1
+                continue
+            
+            pending_hashes.add(file_hash)
+            pending.append((file_path, file_stat, file_hash))
+        
+        # EXIF parsing runs in parallel for large batches. The full hash is left to
+        # move_file, which only computes it for a conflict or a full verify; duplicates
+        # are keyed on the quick hash, which already leads with the file size.
+        infos = get_file_info_batch(
+            [item[0] for item in pending],
+            [item[1] for item in pending]
         )
-        return "added"
+        
+        rows = []
+        for (_, _, file_hash), info in zip(pending, infos):
+            if not info:  # Rejection (Symlink etc)
+                blocked += 1
+                continue
+            
+            info['quick_hash'] = file_hash
+            
+            if self.target_folder:
+                new_path = calculate_new_path(info, self.target_folder)
+                rel = get_relative_path(new_path, self.target_folder)
+            else:
+                rel = "..."
+            
+            self.files_data.append(info)
+            self.added_hashes.add(file_hash)
+            
+            rows.append((
+                info['filename'], 
+                info['date_str'], 
+                info['device'], 
+                self._sanitize_path_display(rel, 30)
+            ))
+            added += 1
+        
+        # One bulk insert instead of a table update per file
+        self.file_table.add_rows(rows)
+        
+        hash_cache.flush()
+        return added, duplicates, blocked
 
     def _select_folder(self):
+        from tkinter import filedialog  # Lazy: only needed when the dialog opens
+        
         folder = filedialog.askdirectory(title="Select Target Folder")
         if folder:
             # Security: Validate folder
@@ -597,7 +741,7 @@ class LumeApp(TkinterDnD.Tk):
         self.file_table.clear()
         self.progress.reset()
         self.progress.update_labels(self._get_text("ready"))
-        self.file_count_label.configure(text=f"0 {self._get_text('files')}")
+        self.file_count_label.configure(text=f"0 {self._files_suffix}")
 
     def _start_organizing(self):
         """Starts the organization process."""
@@ -622,25 +766,30 @@ class LumeApp(TkinterDnD.Tk):
     def _organize_files_thread(self):
         total = len(self.files_data)
         success = 0
+        verify_mode = self.config.get("verify_mode", "auto")
+        last_update = time.monotonic()
         
         for i, info in enumerate(self.files_data):
             try:
-                # Rate limiting to prevent CPU overload
-                time.sleep(0.01)
-                
-                ok = move_file(info, self.target_folder)
+                ok = move_file(info, self.target_folder, verify_mode=verify_mode)
                 if ok: 
                     success += 1
             except Exception as e:
                 # Security: Log details, show generic to user
                 logger.error(f"Error moving file: {str(e)}", exc_info=True)
             
-            # Update progress
+            # Update progress (coalesced so the Tk event queue is not flooded)
+            now = time.monotonic()
+            if now - last_update < PROGRESS_UPDATE_INTERVAL and i < total - 1:
+                continue
+            last_update = now
+            
             self.after(0, lambda c=i+1: self.progress.update_progress(
                 c, total, 
                 self._get_text("processing", percentage=int((c/total)*100), current=c, total=total)
             ))
         
+        hash_cache.flush()
         self.after(0, lambda: self._on_complete(success))
 
     def _on_complete(self, count):
@@ -650,5 +799,7 @@ class LumeApp(TkinterDnD.Tk):
 
 
 if __name__ == "__main__":
+    # Required for the EXIF worker processes in the frozen .exe build
+    multiprocessing.freeze_support()
     app = LumeApp()
     app.mainloop()
@@ -3,6 +3,8 @@ Lume Centralized Translation System
 Supports: English (en), Turkish (tr)
 """
 
+from functools import lru_cache
+
 TRANSLATIONS = {
     "en": {
         "file_list": "📋 File List",
@@ -66,10 +68,18 @@ TRANSLATIONS = {
     }
 }
 
+# Bound lookups, resolved once at import
+_LOOKUPS = {lang: batch.get for lang, batch in TRANSLATIONS.items()}
+_FALLBACK_LOOKUP = _LOOKUPS["en"]
+
+@lru_cache(maxsize=512)
+def _get_text_nokw(lang, key):
+    """Cached (lang, key) -> text lookup; translations never change at runtime."""
+    return _LOOKUPS.get(lang, _FALLBACK_LOOKUP)(key, key)
+
 def get_text(lang, key, **kwargs):
     """Safely retrieves translated text with fallback."""
-    lang_batch = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
-    text = lang_batch.get(key, key)
+    text = _get_text_nokw(lang, key)
     
     if kwargs:
         try:
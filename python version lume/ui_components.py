@@ -3,8 +3,24 @@ UI Components Module (Standard Tkinter & TTK)
 Zero CustomTkinter dependency.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
+from functools import lru_cache
+
+_style = None
+
+def _shared_style():
+    """Returns the single ttk.Style shared by all components (created on first use)."""
+    global _style
+    if _style is None:
+        _style = ttk.Style()
+    return _style
+
+@lru_cache(maxsize=4096)
+def _ellipsize(text):
+    """Truncates table cell text to 30 chars, keeping the tail (cached: dates, devices and folders repeat)."""
+    return text if len(text) <= 30 else "..." + text[-27:]
 
 class DropZone(tk.Frame):
     """Drag-and-drop area (Standard Tkinter)."""
@@ -29,6 +45,9 @@ class DropZone(tk.Frame):
         self.inner_label.pack(fill="both", expand=True)
         
         self.subtext = tk.Label(self, text="", bg=self.bg_color) 
+        
+        # Tcl paths for direct configure calls in highlight/update_theme
+        self._paths = (str(self), str(self.inner_label), str(self.subtext))
 
     def update_labels(self, main_text, sub_text):
         """Updates internal labels for translation."""
@@ -38,20 +57,31 @@ class DropZone(tk.Frame):
     def highlight(self, active=True):
         """Changes color during hover."""
         color = self.active_color if active else self.bg_color
-        self.configure(bg=color)
-        self.inner_label.configure(bg=color)
-        self.subtext.configure(bg=color)
+        tkcall = self.tk.call
+        for path in self._paths:
+            tkcall(path, 'configure', '-bg', color)
 
     def update_theme(self, bg_color, card_color, fg_color, active_color):
         """Updates theme dynamically."""
         self.bg_color = card_color
         self.active_color = active_color
-        self.configure(bg=self.bg_color)
-        self.inner_label.configure(bg=self.bg_color, fg=fg_color)
-        self.subtext.configure(bg=self.bg_color)
+        frame_path, inner_path, subtext_path = self._paths
+        tkcall = self.tk.call
+        tkcall(frame_path, 'configure', '-bg', self.bg_color)
+        tkcall(inner_path, 'configure', '-bg', self.bg_color, '-fg', fg_color)
+        tkcall(subtext_path, 'configure', '-bg', self.bg_color)
 
 class FileTable(tk.Frame):
-    """File list table (Scrollable Canvas with mouse wheel support)."""
+    """File list table (ttk.Treeview: rows are Tcl items, not widgets)."""
+    
+    COLUMNS = ("file", "date", "device", "path")
+    COLUMN_WEIGHTS = (0.3, 0.2, 0.2, 0.3)
+    ROW_HEIGHT = 22
+    STYLE = "Lume.Treeview"
+    THEMES = {  # Keyed by is_dark
+        False: {"header_bg": "#EEEEEE"},
+        True: {"header_bg": "#333333"},
+    }
     
     def __init__(self, master, height=200, **kwargs):
         # Theme color tracking - default to light mode
@@ -64,191 +94,254 @@ class FileTable(tk.Frame):
         kwargs['bg'] = self.current_bg
         super().__init__(master, **kwargs)
         
-        self.canvas = tk.Canvas(self, height=height, bg=self.current_bg, highlightthickness=0)
-        self.scrollable_frame = tk.Frame(self.canvas, bg=self.current_bg)
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # The "clam" theme itself is selected once in LumeApp.__init__
+        self.style = _shared_style()
+        self.style.configure(self.STYLE, font=("Segoe UI", 9), rowheight=self.ROW_HEIGHT, borderwidth=0)
+        self.style.configure(f"{self.STYLE}.Heading", font=("Segoe UI", 9, "bold"), relief="flat", padding=(10, 2))
+        self._apply_style()
+        
+        self.tree = ttk.Treeview(
+            self,
+            columns=self.COLUMNS,
+            show="headings",
+            height=max(1, height // self.ROW_HEIGHT - 1),
+            style=self.STYLE,
+            selectmode="none"
         )
-
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.bind("<Configure>", self._on_resize)
+        for col, weight in zip(self.COLUMNS, self.COLUMN_WEIGHTS):
+            self.tree.column(col, width=int(600 * weight), anchor="w", stretch=True)
         
         # Mouse wheel scrolling (no visible scrollbar)
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
-        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
-
-        self.canvas.pack(fill="both", expand=True)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
         
-        self.rows = []
-        self._create_header()
+        self.tree.pack(fill="both", expand=True)
+        
+        # Display rows are cached first and pushed to the tree in one idle pass
+        self._row_cache = []
+        self._rendered = 0
+        self._render_scheduled = False
+        
+        self.refresh_headers(["File", "Date", "Device", "New Path"])
     
     def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-    def _on_resize(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        self.tree.yview_scroll(int(-1*(event.delta/120)), "units")
+        return "break"
 
-    def _create_header(self, col_names=None):
-        if hasattr(self, 'header_frame'):
-            self.header_frame.destroy()
-            
-        self.header_frame = tk.Frame(self.scrollable_frame, bg=self.current_header_bg)
-        self.header_frame.pack(fill="x", pady=(0, 5), before=self.scrollable_frame.winfo_children()[0] if self.rows else None)
-        
-        if not col_names:
-            col_names = ["File", "Date", "Device", "New Path"]
-            
-        columns = [(col_names[0], 0.3), (col_names[1], 0.2), (col_names[2], 0.2), (col_names[3], 0.3)]
-        for text, weight in columns:
-            lbl = tk.Label(self.header_frame, text=text, font=("Segoe UI", 9, "bold"), bg=self.current_header_bg, fg=self.current_fg, anchor="w", padx=10)
-            lbl.pack(side="left", expand=True, fill="x")
+    def _apply_style(self):
+        """Pushes the current colors into the shared Treeview style."""
+        self.style.configure(
+            self.STYLE,
+            background=self.current_bg,
+            fieldbackground=self.current_bg,
+            foreground=self.current_fg
+        )
+        self.style.configure(f"{self.STYLE}.Heading", background=self.current_header_bg, foreground=self.current_fg)
+        self.style.map(f"{self.STYLE}.Heading", background=[("active", self.current_header_bg)])
 
     def refresh_headers(self, col_names):
         """Updates table headers for translation."""
-        self._create_header(col_names)
+        for col, text in zip(self.COLUMNS, col_names):
+            self.tree.heading(col, text=text, anchor="w")
 
     def add_row(self, filename, date, device, new_path):
-        row = tk.Frame(self.scrollable_frame, bg=self.current_bg)
-        row.pack(fill="x", pady=1)
-        
-        vals = [filename, date, device, new_path]
-        for val in vals:
-            display = val if len(val) <= 30 else "..." + val[-27:]
-            lbl = tk.Label(row, text=display, font=("Segoe UI", 9), bg=self.current_bg, fg=self.current_fg, anchor="w", padx=10)
-            lbl.pack(side="left", expand=True, fill="x")
-        
-        self.rows.append(row)
+        self.add_rows([(filename, date, device, new_path)])
+
+    def add_rows(self, rows):
+        """Queues many (filename, date, device, new_path) rows; rendered together when idle."""
+        self._row_cache.extend(tuple(_ellipsize(val) for val in vals) for vals in rows)
+        self._schedule_render()
+
+    def _schedule_render(self):
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.after_idle(self._render_rows)
+
+    def _render_rows(self):
+        """Inserts cached rows not yet shown in the tree."""
+        self._render_scheduled = False
+        insert = self.tree.insert
+        for values in self._row_cache[self._rendered:]:
+            insert("", "end", values=values)
+        self._rendered = len(self._row_cache)
 
     def clear(self):
-        for row in self.rows:
-            row.destroy()
-        self.rows = []
+        self._row_cache.clear()
+        self._rendered = 0
+        self.tree.delete(*self.tree.get_children())
+        _ellipsize.cache_clear()
 
-    def update_theme(self, bg_color, card_color, fg_color, header_bg=None):
-        # Store current theme colors for new rows
+    def update_theme(self, bg_color, card_color, fg_color, *, is_dark, header_bg=None):
+        # Store current theme colors
         self.current_bg = card_color
         self.current_fg = fg_color
-        self.is_dark = fg_color == "#FFFFFF"
-        self.current_header_bg = header_bg if header_bg else ("#333333" if self.is_dark else "#EEEEEE")
+        self.is_dark = is_dark
+        self.current_header_bg = header_bg or self.THEMES[self.is_dark]["header_bg"]
         
-        # Update parent frame background
+        # Rows are restyled by Tk through the shared style, not one widget at a time
         self.configure(bg=card_color)
-        self.canvas.configure(bg=card_color)
-        self.scrollable_frame.configure(bg=card_color)
-        
-        for child in self.scrollable_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                is_header = child == getattr(self, 'header_frame', None)
-                new_bg = self.current_header_bg if is_header else card_color
-                child.configure(bg=new_bg)
-                
-                for label in child.winfo_children():
-                    if isinstance(label, tk.Label):
-                        label.configure(bg=new_bg, fg=fg_color)
+        self._apply_style()
 
 class ProgressDialog(tk.Frame):
     """Progress bar and status display with full theme support."""
     
+    RENDER_INTERVAL = 0.05  # Seconds between redraws; the final update always renders
+    SUCCESS_COLOR = "#4CAF50"
+    STYLE = "Lume.Horizontal.TProgressbar"
+    THEMES = {  # Keyed by is_dark
+        False: {"trough": "#E0E0E0", "bar": "#4CAF50", "muted": "#666666"},
+        True: {"trough": "#333333", "bar": "#6366f1", "muted": "#AAAAAA"},
+    }
+    
     def __init__(self, master, **kwargs):
         # Extract bg from kwargs for proper initialization - default to light
         self.current_bg = kwargs.get('bg', '#FFFFFF')
         self.is_dark = False  # Default to light
         super().__init__(master, **kwargs)
         
-        # Custom canvas-based progress bar for full theme control
+        # Native ttk progress bar, themed through its own style
         self.progress_var = tk.DoubleVar()
         self.bar_height = 8
         
         # Trough (background track) - default to light mode
-        self.trough_color = "#E0E0E0"
-        self.bar_color = "#4CAF50"
+        theme = self.THEMES[self.is_dark]
+        self.trough_color = theme["trough"]
+        self.bar_color = theme["bar"]
+        self.fill_color = self.bar_color
         
-        self.progress_canvas = tk.Canvas(
-            self, 
-            height=self.bar_height, 
-            bg=self.trough_color,
-            highlightthickness=0
-        )
-        self.progress_canvas.pack(pady=10, padx=20, fill="x")
+        self.style = _shared_style()
+        self.style.configure(self.STYLE, thickness=self.bar_height, borderwidth=0)
+        self._apply_bar_style()
         
-        # Progress fill rectangle
-        self.fill_rect = self.progress_canvas.create_rectangle(
-            0, 0, 0, self.bar_height, 
-            fill=self.bar_color, 
-            outline=""
+        self.progress_bar = ttk.Progressbar(
+            self,
+            variable=self.progress_var,
+            maximum=100,
+            mode="determinate",
+            style=self.STYLE
         )
+        self.progress_bar.pack(pady=10, padx=20, fill="x")
         
         self.status_label = tk.Label(
             self, 
             text="", 
             font=("Segoe UI", 9),
             bg=self.current_bg,
-            fg="#666666"
+            fg=theme["muted"]
         )
         self.status_label.pack()
+        
+        # Coalescing state for update_progress
+        self._last_render = 0.0
+        self._pending = None
+        self._scheduled = False
+        self._last_value = 0.0  # Last value pushed to progress_var
+        self._last_status = ""  # Last text shown in status_label
+        self._status_fg = theme["muted"]  # Current status_label foreground, tracked to avoid cget
 
     def update_progress(self, current, total, message=None):
+        # Coalesced: only the latest value is kept and drawn once on the next idle pass;
+        # inside RENDER_INTERVAL nothing is scheduled unless this is the final update
+        self._pending = (current, total, message)
+        if self._scheduled:
+            return
+        if current < total and time.monotonic() - self._last_render < self.RENDER_INTERVAL:
+            return
+        
+        self._scheduled = True
+        self.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        self._scheduled = False
+        if self._pending is None:  # Cleared by complete()/reset()
+            return
+        
+        self._last_render = time.monotonic()
+        current, total, message = self._pending
+        self._pending = None
+        self._render_progress(current, total, message)
+
+    def _render_progress(self, current, total, message):
         if total > 0:
             percentage = (current / total) * 100
-            self.progress_var.set(percentage)
             
-            # Update the fill rectangle width
-            canvas_width = self.progress_canvas.winfo_width()
-            if canvas_width > 1:  # Avoid division issues on init
-                fill_width = int((percentage / 100) * canvas_width)
-                self.progress_canvas.coords(self.fill_rect, 0, 0, fill_width, self.bar_height)
+            # Sub-pixel steps (finer than 0.1%) would redraw an identical bar
+            value = round(percentage, 1)
+            if value != self._last_value:
+                self.progress_var.set(value)
+                self._last_value = value
             
             status = message if message else f"{int(percentage)}% - {current}/{total} files processed"
-            self.status_label.configure(text=status)
+            if status != self._last_status:
+                self.status_label.configure(text=status)
+                self._last_status = status
 
     def complete(self, success_count, template):
         """Displays completion status."""
-        self.progress_var.set(100)
-        # Fill the entire bar
-        canvas_width = self.progress_canvas.winfo_width()
-        self.progress_canvas.coords(self.fill_rect, 0, 0, canvas_width, self.bar_height)
-        self.progress_canvas.itemconfig(self.fill_rect, fill="#4CAF50")  # Green for success
-        
-        self.status_label.configure(
-            text=template.format(count=success_count),
-            fg="green"
-        )
+        self._pending = None  # Superseded by the full bar
+        
+        # The last tick usually left the bar full already (and light mode fills green)
+        if self._last_value != 100.0:
+            self.progress_var.set(100)
+            self._last_value = 100.0
+        if self.fill_color != self.SUCCESS_COLOR:
+            self.fill_color = self.SUCCESS_COLOR  # Green for success
+            self._apply_bar_style()
+        
+        self._last_status = template.format(count=success_count)
+        self._status_fg = "green"
+        self.status_label.configure(text=self._last_status, fg=self._status_fg)
 
     def update_labels(self, ready_text):
         """Updates ready text."""
-        current_text = self.status_label.cget("text")
-        if "archived" not in current_text and "%" not in current_text:
-            self.status_label.configure(text=ready_text)
+        # Python-side copy of the label text; no cget round-trip
+        current_text = self._last_status
+        if current_text == ready_text or "archived" in current_text or "%" in current_text:
+            return
+        self.status_label.configure(text=ready_text)
+        self._last_status = ready_text
 
     def reset(self):
         """Resets progress bar and status."""
+        self._pending = None
+        self._last_render = 0.0
         self.progress_var.set(0)
-        self.progress_canvas.coords(self.fill_rect, 0, 0, 0, self.bar_height)
-        self.progress_canvas.itemconfig(self.fill_rect, fill=self.bar_color)
-        self.status_label.configure(text="", fg="#AAAAAA" if self.is_dark else "#666666")
+        self._last_value = 0.0
+        self.fill_color = self.bar_color
+        self._apply_bar_style()
+        self._last_status = ""
+        self._status_fg = self.THEMES[self.is_dark]["muted"]
+        self.status_label.configure(text="", fg=self._status_fg)
 
-    def update_theme(self, bg_color, fg_color):
+    def update_theme(self, bg_color, fg_color, *, is_dark):
         self.current_bg = bg_color
-        self.is_dark = fg_color == "#FFFFFF"
-        self.configure(bg=bg_color)
-        self.status_label.configure(bg=bg_color)
+        self.is_dark = is_dark
+        tkcall = self.tk.call
+        tkcall(str(self), 'configure', '-bg', bg_color)
+        tkcall(str(self.status_label), 'configure', '-bg', bg_color)
         
         # Update progress bar colors
-        self.trough_color = "#333333" if self.is_dark else "#E0E0E0"
-        self.bar_color = "#6366f1" if self.is_dark else "#4CAF50"
-        
-        self.progress_canvas.configure(bg=self.trough_color)
+        theme = self.THEMES[self.is_dark]
+        self.trough_color = theme["trough"]
+        self.bar_color = theme["bar"]
         
-        # Only update fill color if not showing success (green)
-        current_fill = self.progress_canvas.itemcget(self.fill_rect, "fill")
-        if current_fill != "#4CAF50":
-            self.progress_canvas.itemconfig(self.fill_rect, fill=self.bar_color)
+        # Only update fill color if not showing success (green); tracked in Python, no itemcget
+        if self.fill_color != self.SUCCESS_COLOR:
+            self.fill_color = self.bar_color
+        self._apply_bar_style()
         
-        # Update foreground color only if not showing success (green)
-        current_fg = self.status_label.cget("fg")
-        if current_fg != "green":
-            new_fg = "#AAAAAA" if self.is_dark else "#666666"
+        # Update foreground color only if not showing success (green) and it actually changes
+        new_fg = theme["muted"]
+        if self._status_fg not in ("green", new_fg):
+            self._status_fg = new_fg
             self.status_label.configure(fg=new_fg)
+
+    def _apply_bar_style(self):
+        """Pushes trough and fill colors into the progress bar style."""
+        self.style.configure(
+            self.STYLE,
+            troughcolor=self.trough_color,
+            bordercolor=self.trough_color,
+            background=self.fill_color,
+            lightcolor=self.fill_color,
+            darkcolor=self.fill_color
+        )